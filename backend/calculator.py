@@ -1,24 +1,91 @@
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, FrozenSet, Optional, Tuple, Union
 from collections import defaultdict
 
-class AuctionValueCalculator:
-    def __init__(self):
-        self.categories = ['points', 'rebounds', 'assists', 'steals', 'blocks',
-                          'threes', 'fg_pct', 'ft_pct', 'turnovers']
-        self.counting_cats = ['points', 'rebounds', 'assists', 'steals', 'blocks', 'threes']
-        self.percentage_cats = ['fg_pct', 'ft_pct']
-        self.negative_cats = ['turnovers']
-
-        self.position_slots = {
-            'PG': 1, 'SG': 1, 'SF': 1, 'PF': 1, 'C': 1,
-            'G': 1, 'F': 1, 'UTIL': 2
-        }
+_CATEGORIES = ('points', 'rebounds', 'assists', 'steals', 'blocks',
+               'threes', 'fg_pct', 'ft_pct', 'turnovers')
+_COUNTING_CATS = frozenset({'points', 'rebounds', 'assists', 'steals', 'blocks', 'threes'})
+_PERCENTAGE_CATS = frozenset({'fg_pct', 'ft_pct'})
+_NEGATIVE_CATS = frozenset({'turnovers'})
+
+_POSITION_SLOTS = {
+    'PG': 1, 'SG': 1, 'SF': 1, 'PF': 1, 'C': 1,
+    'G': 1, 'F': 1, 'UTIL': 2
+}
+
+_POSITION_GROUPS = {
+    'PG': 'G', 'SG': 'G', 'G': 'G',
+    'SF': 'F', 'PF': 'F', 'F': 'F',
+    'C': 'C'
+}
+
+# ADP value curve: top players get more budget, with a progressive decline.
+# Segment i covers ranks up to _ADP_CURVE_BREAKS[i] and is linear,
+# start - (rank - offset) * slope; ranks past the last break are worth $1.
+_ADP_CURVE_BREAKS = np.array([5, 10, 20, 40, 80, 120])
+# Value at each segment's first rank (1, 6, 11, 21, 41, 81, 121): $75, $54, $32, $13, $5, $2, $1
+_ADP_CURVE_START = np.array([75, 59, 34, 14, 6, 3, 1], dtype=np.float64)
+_ADP_CURVE_OFFSET = np.array([1, 5, 10, 20, 40, 80, 0], dtype=np.float64)
+_ADP_CURVE_SLOPE = np.array([4, 5, 2, 0.4, 0.075, 0.05, 0])
+
+# Only players with an ADP rank up to this are blended with their ADP
+_MAX_BLEND_ADP_RANK = 200
+# Last ADP rank that gets any blend weight
+_ADP_BLEND_LAST_RANK = 60
+
+
+def _adp_table_index(adp_ranks: np.ndarray, max_rank: int, last_index: int) -> np.ndarray:
+    """Map ADP ranks to lookup-table indices; 0 means no usable ADP data.
+
+    The tables are defined on whole ranks, so fractional ranks are rounded
+    up. A rank r passes every `rank <= k` cutoff of the curve and the blend
+    ladder exactly when ceil(r) does, so segments and weights match the
+    unrounded rank; only the position inside a curve segment is rounded.
+    Ranks past last_index share its entry, where the tables are flat.
+    """
+    adp_ranks = np.ceil(adp_ranks)
+    has_adp = (adp_ranks > 0) & (adp_ranks <= max_rank)
+    return np.where(has_adp, np.minimum(adp_ranks, last_index), 0).astype(int)
+
+
+def _build_adp_value_table() -> np.ndarray:
+    """Auction value for each ADP rank through the first flat $1 rank (index 0 = no ADP)"""
+    ranks = np.arange(_ADP_CURVE_BREAKS[-1] + 2, dtype=np.float64)
+    segments = np.searchsorted(_ADP_CURVE_BREAKS, ranks, side='left')
+    curve = (
+        _ADP_CURVE_START[segments]
+        - (ranks - _ADP_CURVE_OFFSET[segments]) * _ADP_CURVE_SLOPE[segments]
+    )
+
+    table = np.maximum(1, np.trunc(curve)).astype(int)
+    table[0] = 1  # Players without ADP data get $1
+    table.flags.writeable = False
+    return table
+
+
+def _build_adp_blend_weight_table() -> np.ndarray:
+    """ADP blend weight for each ADP rank through the first 0% rank (index 0 = no ADP)"""
+    ranks = np.arange(_ADP_BLEND_LAST_RANK + 2)
+
+    # Variable weighting based on ADP rank - reduced ADP influence
+    table = np.select(
+        [ranks == 0, ranks <= 20, ranks <= 40, ranks <= 60],
+        [0.0, 0.35, 0.20, 0.10],  # Top 20: 35%, top 40: 20%, top 60: 10% ADP weight
+        default=0.0  # Beyond 60: 0% ADP weight (pure z-scores)
+    )
+    table.flags.writeable = False
+    return table
+
+
+_ADP_VALUE_TABLE = _build_adp_value_table()
+_ADP_BLEND_WEIGHTS = _build_adp_blend_weight_table()
+
 
+class AuctionValueCalculator:
     def calculate_auction_values(
         self,
-        players: List[Dict],
+        players: Union[List[Dict], pd.DataFrame],
         punted_cats: List[str] = None,
         category_weights: Dict[str, float] = None,
         inflation_rate: float = 0.0,
@@ -26,142 +93,138 @@ class AuctionValueCalculator:
         roster_size: int = 13,
         budget: int = 200,
         adp_weight: float = 0.5,  # How much to weight ADP vs z-scores in value calc
-        min_games: int = 30  # Minimum games required for consideration
+        min_games: int = 30,  # Minimum games required for consideration
+        prepared: bool = False  # players is a frame from prepare_players
     ) -> List[Dict]:
-        if not players:
+        # Callers that already hold a DataFrame can pass it directly; it is
+        # copied by the games filter below, so it is never modified
+        if isinstance(players, pd.DataFrame):
+            if players.empty:
+                return []
+            df = players
+        elif not players:
             return []
+        else:
+            df = pd.DataFrame(players)
 
-        punted_cats = punted_cats or []
+        punted_cats = frozenset(punted_cats or [])
         category_weights = category_weights or {}
-        df = pd.DataFrame(players)
 
-        # Filter out players with too few games
-        df = df[df['games'] >= min_games].copy()
+        # Filter out players with too few games. Boolean indexing already
+        # copies the rows, so a shallow copy is enough to detach the result
+        # from the caller's frame before columns are added to it
+        df = df[df['games'] >= min_games].copy(deep=False)
 
-        df = self._clean_positions(df)
+        if not prepared:
+            df = self._clean_positions(df)
 
-        df = self._calculate_percentages(df)
+            df = self._calculate_percentages(df)
 
         z_scores = self._calculate_z_scores(df, punted_cats, category_weights)
 
+        # Extract the columns the value pipeline needs once, as numpy arrays
+        total_z = z_scores['total_z'].to_numpy()
+        if 'adp_rank' in df.columns:
+            adp_ranks = df['adp_rank'].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            adp_ranks = np.full(len(df), np.nan)
+
+        # ADP blend weight per player, shared by the value blend and the
+        # blend rank; players without real ADP data get a weight of 0
+        blend_idx = _adp_table_index(
+            adp_ranks, _MAX_BLEND_ADP_RANK, len(_ADP_BLEND_WEIGHTS) - 1
+        )
+        blend_weights = _ADP_BLEND_WEIGHTS[blend_idx]
+
         replacement_level = self._calculate_replacement_level(
-            z_scores, league_teams, roster_size
+            total_z, league_teams, roster_size
         )
 
         # Get ADP-based values and z-score based values
         z_score_values = self._calculate_values_above_replacement(
-            z_scores, replacement_level, league_teams, budget
+            total_z, replacement_level, league_teams, budget
         )
 
         adp_values = self._calculate_adp_based_values(
-            df, league_teams, budget
+            adp_ranks, league_teams, budget
         )
 
         # Calculate punt aggressiveness (how much we're deviating from standard)
-        punt_factor = 0
-        for weight in category_weights.values():
-            if weight == 0:
-                punt_factor += 0.3  # Strong punt
-            elif weight < 0.5:
-                punt_factor += 0.15  # De-emphasis
-            elif weight > 1.5:
-                punt_factor += 0.1  # Strong emphasis
+        weights = np.fromiter(category_weights.values(), dtype=np.float64, count=len(category_weights))
+        punt_factor = (
+            np.count_nonzero(weights == 0) * 0.3  # Strong punt
+            + np.count_nonzero((weights != 0) & (weights < 0.5)) * 0.15  # De-emphasis
+            + np.count_nonzero(weights > 1.5) * 0.1  # Strong emphasis
+        )
 
         # Reduce ADP influence when punting (use more z-scores)
         adjusted_adp_weight = max(0.2, adp_weight * (1 - min(0.5, punt_factor)))
 
         # Blend the two value systems
         values = self._blend_values(
-            z_score_values, adp_values, df, adjusted_adp_weight
+            z_score_values, adp_values, blend_weights, adjusted_adp_weight
         )
 
         if inflation_rate > 0:
             values = self._apply_inflation(values, inflation_rate)
 
-        result = []
-        for idx, row in df.iterrows():
-            player_dict = row.to_dict()
-            player_dict['z_score_total'] = float(z_scores.loc[idx, 'total_z'])
-            player_dict['auction_value'] = int(values.loc[idx])
-            player_dict['value_rank'] = 0
-
-            # Add individual category z-scores (use raw for display)
-            for cat in self.categories:
-                z_col_raw = f'z_{cat}_raw'
-                z_col = f'z_{cat}'
-                # Use raw z-scores for display purposes
-                if z_col_raw in z_scores.columns:
-                    player_dict[z_col] = float(z_scores.loc[idx, z_col_raw])
-
-            # Convert numpy types to native Python types
-            for key, value in player_dict.items():
-                if hasattr(value, 'item'):  # numpy scalar
-                    if 'int' in str(type(value)):
-                        player_dict[key] = int(value)
-                    else:
-                        player_dict[key] = float(value)
-                elif isinstance(value, (np.integer, np.int64)):
-                    player_dict[key] = int(value)
-                elif isinstance(value, (np.floating, np.float64)):
-                    player_dict[key] = float(value)
-
-            result.append(player_dict)
-
-        result = sorted(result, key=lambda x: x['auction_value'], reverse=True)
-        for i, player in enumerate(result):
-            player['value_rank'] = i + 1
-
-            # Calculate blended rank (ADP + Value Rank)
-            # Weight ADP more heavily for top players
-            adp_rank = player.get('adp_rank')
-            value_rank = player['value_rank']
-
-            if adp_rank and adp_rank <= 200:  # Only blend if we have real ADP data
-                if adp_rank <= 20:
-                    # Top 20: 35% ADP, 65% calculated
-                    blend_weight = 0.35
-                elif adp_rank <= 40:
-                    # Top 40: 20% ADP, 80% calculated
-                    blend_weight = 0.20
-                elif adp_rank <= 60:
-                    # Top 60: 10% ADP, 90% calculated
-                    blend_weight = 0.10
-                else:
-                    # Beyond 60: 0% ADP, 100% calculated
-                    blend_weight = 0.0
-
-                player['blend_rank'] = (adp_rank * blend_weight) + (value_rank * (1 - blend_weight))
-            else:
-                # No ADP or very low - just use value rank
-                player['blend_rank'] = value_rank
-
-        # Re-sort by blend rank and assign final blend rankings
-        result = sorted(result, key=lambda x: x['blend_rank'])
-        for i, player in enumerate(result):
-            player['blend_rank'] = i + 1
-
-        # Re-sort back by value rank for display
-        result = sorted(result, key=lambda x: x['value_rank'])
-
-        return result
+        num_players = len(values)
+
+        # Rank by auction value; a stable sort keeps ties in input order
+        value_order = np.argsort(-values, kind='stable')
+        value_ranks = np.empty(num_players, dtype=int)
+        value_ranks[value_order] = np.arange(1, num_players + 1)
+
+        df['z_score_total'] = total_z
+        df['auction_value'] = values
+        df['value_rank'] = value_ranks
+
+        # Add individual category z-scores (use raw for display). They are
+        # attached by position, since a caller's frame may repeat index labels
+        for cat in _CATEGORIES:
+            raw_col = f'z_{cat}_raw'
+            if raw_col in z_scores.columns:
+                df[f'z_{cat}'] = z_scores[raw_col].to_numpy()
+
+        # Calculate blended rank (ADP + Value Rank)
+        # Weight ADP more heavily for top players; players with no ADP weight
+        # just use their value rank
+        blend_scores = np.where(
+            blend_weights > 0,
+            adp_ranks * blend_weights + value_ranks * (1 - blend_weights),
+            value_ranks
+        )
+
+        # Assign final blend rankings, breaking ties by value rank
+        blend_ranks = np.empty(num_players, dtype=int)
+        blend_ranks[np.lexsort((value_ranks, blend_scores))] = np.arange(1, num_players + 1)
+        df['blend_rank'] = blend_ranks
+
+        # Sort by value rank for display. The computed columns are already
+        # int64/float64, so to_dict returns native Python ints and floats
+        return df.iloc[value_order].to_dict(orient='records')
+
+    def prepare_players(self, players: List[Dict]) -> pd.DataFrame:
+        """Build a player frame with position groups and weighted percentages.
+
+        These steps only depend on each player's own stats, so the frame can
+        be built once and reused across calls with prepared=True.
+        """
+        df = pd.DataFrame(players)
+        if df.empty:
+            return df
+
+        df = self._clean_positions(df)
+        return self._calculate_percentages(df)
 
     def _clean_positions(self, df: pd.DataFrame) -> pd.DataFrame:
-        def clean_pos(pos):
-            if pd.isna(pos) or pos == '':
-                return 'UTIL'
-            pos = str(pos).upper().strip()
-            if '-' in pos:
-                pos = pos.split('-')[0]
-            if pos in ['PG', 'SG', 'G']:
-                return 'G'
-            elif pos in ['SF', 'PF', 'F']:
-                return 'F'
-            elif pos in ['C']:
-                return 'C'
-            else:
-                return 'UTIL'
-
-        df['position_group'] = df['position'].apply(clean_pos)
+        # Use the primary position for multi-position players (e.g. 'PG-SG')
+        primary_pos = (
+            df['position'].fillna('').astype(str)
+            .str.upper().str.strip()
+            .str.split('-').str[0]
+        )
+        df['position_group'] = primary_pos.map(_POSITION_GROUPS).fillna('UTIL')
         return df
 
     def _calculate_percentages(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -179,97 +242,94 @@ class AuctionValueCalculator:
 
         return df
 
-    def _calculate_z_scores(self, df: pd.DataFrame, punted_cats: List[str], category_weights: Dict[str, float]) -> pd.DataFrame:
-        z_scores = pd.DataFrame(index=df.index)
-
+    def _category_values(self, df: pd.DataFrame, cat: str) -> np.ndarray:
+        """Per-game values for a category, negated for negative categories"""
+        if cat in _COUNTING_CATS:
+            # Use per-game averages instead of totals
+            # This ensures fair comparison regardless of games played
+            if cat in df.columns:
+                return df[cat].to_numpy(dtype=np.float64)  # Already per-game
+            # Convert totals to per-game if needed
+            col_name = f'total_{cat}'
+            if col_name in df.columns:
+                return (df[col_name] / df['games']).to_numpy(dtype=np.float64)
+            return np.zeros(len(df))
+        elif cat == 'fg_pct':
+            return df['fg_pct_weighted'].to_numpy(dtype=np.float64)
+        elif cat == 'ft_pct':
+            return df['ft_pct_weighted'].to_numpy(dtype=np.float64)
+        elif cat == 'turnovers':
+            # Use per-game turnovers (negative impact)
+            if 'turnovers' in df.columns:
+                return -df['turnovers'].to_numpy(dtype=np.float64)  # Already per-game
+            if 'total_turnovers' in df.columns:
+                return -(df['total_turnovers'] / df['games']).to_numpy(dtype=np.float64)
+            return np.zeros(len(df))
+        return df[cat].to_numpy(dtype=np.float64)
+
+    def _calculate_z_scores(self, df: pd.DataFrame, punted_cats: FrozenSet[str], category_weights: Dict[str, float]) -> pd.DataFrame:
         # If no weights provided, use 1.0 for all non-punted categories
         default_weight = 1.0
 
-        for cat in self.categories:
-            # Skip punted categories (backward compatibility)
-            if cat in punted_cats:
-                continue
-
-            # Get weight for this category (default to 1.0 if not specified)
-            weight = category_weights.get(cat, default_weight)
-
-            # Skip categories with 0 weight
-            if weight == 0:
-                continue
-
-            if cat in self.counting_cats:
-                # Use per-game averages instead of totals
-                # This ensures fair comparison regardless of games played
-                if cat in df.columns:
-                    values = df[cat]  # Already per-game
-                else:
-                    # Convert totals to per-game if needed
-                    col_name = f'total_{cat}'
-                    if col_name in df.columns:
-                        values = df[col_name] / df['games']
-                    else:
-                        values = df.get(cat, 0)
-            elif cat == 'fg_pct':
-                values = df['fg_pct_weighted']
-            elif cat == 'ft_pct':
-                values = df['ft_pct_weighted']
-            elif cat == 'turnovers':
-                # Use per-game turnovers (negative impact)
-                if 'turnovers' in df.columns:
-                    values = -df['turnovers']  # Already per-game
-                elif 'total_turnovers' in df.columns:
-                    values = -(df['total_turnovers'] / df['games'])
-                else:
-                    values = -df.get('turnovers', 0)
-            else:
-                values = df[cat]
-
-            mean_val = values.mean()
-            std_val = values.std()
-
-            if std_val > 0:
-                # Calculate raw z-score
-                raw_z = (values - mean_val) / std_val
-
-                # Apply non-linear scaling for punts (exponential scaling)
-                # This makes punt decisions more impactful
-                if weight == 0:
-                    # Completely punted - severe penalty for good performance
-                    weighted_z = raw_z * -0.5 if raw_z > 0 else 0
-                elif weight < 0.5:
-                    # De-emphasized - exponential penalty
-                    weighted_z = raw_z * (weight ** 2)
-                elif weight > 1.5:
-                    # Emphasized - exponential bonus
-                    weighted_z = raw_z * (weight ** 1.5)
-                else:
-                    # Normal weight - standard linear
-                    weighted_z = raw_z * weight
-
-                # Store both raw and weighted z-scores
-                z_scores[f'z_{cat}_raw'] = raw_z  # For display
-                z_scores[f'z_{cat}'] = weighted_z  # For calculation
-            else:
-                z_scores[f'z_{cat}_raw'] = 0
-                z_scores[f'z_{cat}'] = 0
-
-        # Only sum the weighted z-scores (not the raw ones)
-        z_score_cols = [col for col in z_scores.columns if col.startswith('z_') and not col.endswith('_raw')]
-        z_scores['total_z'] = z_scores[z_score_cols].sum(axis=1)
+        # Skip punted categories (backward compatibility) and categories with 0 weight
+        active_cats = [
+            cat for cat in _CATEGORIES
+            if cat not in punted_cats and category_weights.get(cat, default_weight) != 0
+        ]
+        weights = np.array(
+            [category_weights.get(cat, default_weight) for cat in active_cats], dtype=np.float64
+        )
+
+        # Pack all category values into a single (players x categories) array
+        values = np.empty((len(df), len(active_cats)), dtype=np.float64)
+        for i, cat in enumerate(active_cats):
+            values[:, i] = self._category_values(df, cat)
+
+        # Missing (NaN) stats are left out of the mean and spread; a category
+        # with fewer than two values has no spread and scores 0 below
+        counts = np.count_nonzero(~np.isnan(values), axis=0)
+        has_values = counts >= 2
+        mean_vals = np.zeros(len(active_cats))
+        std_vals = np.zeros(len(active_cats))
+        if has_values.any():
+            mean_vals[has_values] = np.nanmean(values[:, has_values], axis=0)
+            std_vals[has_values] = np.nanstd(values[:, has_values], axis=0, ddof=1)
+
+        # Calculate raw z-scores in place; categories with no spread score 0
+        has_spread = std_vals > 0
+        raw_z = values
+        raw_z -= mean_vals
+        np.divide(raw_z, std_vals, out=raw_z, where=has_spread)
+        raw_z[:, ~has_spread] = 0
+
+        # Apply non-linear scaling for weights (exponential scaling)
+        # This makes punt decisions more impactful
+        scale = np.select(
+            [weights < 0.5, weights > 1.5],
+            [weights ** 2, weights ** 1.5],  # De-emphasized penalty, emphasized bonus
+            default=weights  # Normal weight - standard linear
+        )
+
+        # Keep raw z-scores for display; the weighted z-scores are only
+        # needed for the total, so they are summed without being stored
+        z_scores = pd.DataFrame(
+            raw_z, index=df.index, columns=[f'z_{cat}_raw' for cat in active_cats]
+        )
+
+        # Missing stats keep a NaN raw z-score for display but count as 0
+        # toward the total and the specialist bonus
+        scored_z = np.where(np.isnan(raw_z), 0.0, raw_z)
+        total_z = scored_z @ scale
 
         # Add specialist bonus for players who excel in targeted categories
         # This makes specialists more valuable in punt builds
-        specialist_bonus = 0
-        for cat in self.categories:
-            weight = category_weights.get(cat, default_weight)
-            if weight >= 1.5:  # Highly targeted category
-                raw_col = f'z_{cat}_raw'
-                if raw_col in z_scores.columns:
-                    # Give bonus to players who are elite (z > 1.5) in targeted categories
-                    elite_bonus = z_scores[raw_col].apply(lambda x: max(0, x - 1.5) * 0.5 if x > 1.5 else 0)
-                    specialist_bonus += elite_bonus * weight
-
-        z_scores['total_z'] = z_scores['total_z'] + specialist_bonus
+        targeted = weights >= 1.5  # Highly targeted categories
+        if targeted.any():
+            # Give bonus to players who are elite (z > 1.5) in targeted categories
+            elite_bonus = np.maximum(scored_z[:, targeted] - 1.5, 0.0) * 0.5
+            total_z += elite_bonus @ weights[targeted]
+
+        z_scores['total_z'] = total_z
 
         z_scores['position_group'] = df['position_group']
         z_scores['name'] = df['name']
@@ -279,58 +339,59 @@ class AuctionValueCalculator:
 
     def _calculate_replacement_level(
         self,
-        z_scores: pd.DataFrame,
+        total_z: np.ndarray,
         league_teams: int,
         roster_size: int
     ) -> float:
         total_rostered = league_teams * roster_size
+        num_players = len(total_z)
 
-        # Use average of players around the replacement level for stability
-        sorted_players = z_scores.sort_values('total_z', ascending=False)
-
-        if len(sorted_players) >= total_rostered + 10:
+        # Use average of players around the replacement level for stability.
+        # Partitioning on the negated scores places the needed order statistics
+        # (highest first) without sorting the whole pool.
+        if num_players >= total_rostered + 10:
             # Take average of players ranked 130-150 (more aggressive replacement level)
             # This provides more stable replacement level and reduces total VAR
             start_idx = max(0, total_rostered - 26)  # 130th player (156 - 26)
-            end_idx = min(len(sorted_players), total_rostered - 6)  # 150th player (156 - 6)
+            end_idx = min(num_players, total_rostered - 6)  # 150th player (156 - 6)
 
-            replacement_range = sorted_players.iloc[start_idx:end_idx]['total_z']
-            replacement_level = replacement_range.mean()
-        elif len(sorted_players) >= total_rostered:
+            ranked_z = -np.partition(-total_z, [start_idx, end_idx - 1])
+            replacement_level = ranked_z[start_idx:end_idx].mean()
+        elif num_players > total_rostered:
             # Not enough players for averaging, use the traditional method
-            replacement_level = sorted_players.iloc[total_rostered]['total_z']
+            replacement_level = -np.partition(-total_z, total_rostered)[total_rostered]
         else:
             # If we don't have enough players, use the last one
-            replacement_level = sorted_players.iloc[-1]['total_z'] if len(sorted_players) > 0 else 0
+            replacement_level = total_z.min() if num_players > 0 else 0
 
-        return replacement_level
+        return float(replacement_level)
 
     def _calculate_values_above_replacement(
         self,
-        z_scores: pd.DataFrame,
+        total_z: np.ndarray,
         replacement_level: float,
         league_teams: int,
         budget: int
-    ) -> pd.Series:
-        var_scores = z_scores['total_z'] - replacement_level
-
-        var_scores[var_scores < 0] = 0
+    ) -> np.ndarray:
+        var_scores = np.maximum(total_z - replacement_level, 0.0)
 
         # Boost VAR importance for top 80 players
         # This increases their share of the value pool
-        sorted_indices = var_scores.nlargest(80).index
         scaled_var_scores = var_scores.copy()
 
-        for idx in sorted_indices:
-            # Apply 1.5x multiplier to top 80 players' VAR
-            scaled_var_scores[idx] = var_scores[idx] * 1.5
+        # Apply 1.5x multiplier to top 80 players' VAR; argpartition finds
+        # them without sorting the rest of the pool
+        if var_scores.size > 80:
+            scaled_var_scores[np.argpartition(-var_scores, 79)[:80]] *= 1.5
+        else:
+            scaled_var_scores *= 1.5
 
         top_players = int(league_teams * 13)
 
         # Only the top N players get rostered and have real value
         # Sum VAR only for rosterable players (use scaled values)
-        top_var_scores = scaled_var_scores.nlargest(top_players)
-        total_var = top_var_scores.sum()
+        num_top = min(top_players, scaled_var_scores.size)
+        total_var = np.partition(scaled_var_scores, -num_top)[-num_top:].sum() if num_top > 0 else 0
         total_dollars = league_teams * budget - top_players
 
         if total_var > 0:
@@ -338,95 +399,41 @@ class AuctionValueCalculator:
             # Apply dollar per VAR using scaled VAR scores
             values = scaled_var_scores * dollar_per_var + 1
         else:
-            values = pd.Series(1, index=var_scores.index)
+            values = np.ones_like(var_scores)
 
-        values[values < 1] = 1
+        return np.maximum(np.rint(values).astype(int), 1)
 
-        values = values.round().astype(int)
-
-        return values
-
-    def _apply_inflation(self, values: pd.Series, inflation_rate: float) -> pd.Series:
+    def _apply_inflation(self, values: np.ndarray, inflation_rate: float) -> np.ndarray:
         inflated_values = values * (1 + inflation_rate / 100)
-        inflated_values = inflated_values.round().astype(int)
-        inflated_values[inflated_values < 1] = 1
+        np.rint(inflated_values, out=inflated_values)
+        inflated_values = inflated_values.astype(int)
+        np.maximum(inflated_values, 1, out=inflated_values)
         return inflated_values
 
     def _calculate_adp_based_values(
         self,
-        df: pd.DataFrame,
+        adp: np.ndarray,
         league_teams: int,
         budget: int
-    ) -> pd.Series:
+    ) -> np.ndarray:
         """Calculate auction values based purely on ADP rankings"""
         total_budget = league_teams * budget
         roster_spots = league_teams * 13
 
-        # Create a value curve based on ADP rank
-        # Top players get more budget, declining curve
-        values = pd.Series(1, index=df.index)
-
-        for idx in df.index:
-            adp_rank = df.loc[idx, 'adp_rank'] if 'adp_rank' in df.columns else None
-
-            if adp_rank and adp_rank <= roster_spots:
-                # Use a declining curve: more money for top players
-                # Updated for higher top-end values with progressive decline
-                if adp_rank <= 5:
-                    base_value = 75 - (adp_rank - 1) * 4  # $75, $71, $67, $63, $59
-                elif adp_rank <= 10:
-                    base_value = 59 - (adp_rank - 5) * 5  # $54, $49, $44, $39, $34
-                elif adp_rank <= 20:
-                    base_value = 34 - (adp_rank - 10) * 2  # $32, $30, $28... down to $14
-                elif adp_rank <= 40:
-                    base_value = 14 - (adp_rank - 20) * 0.4  # $13.6, $13.2... down to $6
-                elif adp_rank <= 80:
-                    base_value = 6 - (adp_rank - 40) * 0.075  # $5.9, $5.8... down to $3
-                elif adp_rank <= 120:
-                    base_value = 3 - (adp_rank - 80) * 0.05  # $2.95, $2.90... down to $1
-                else:
-                    base_value = 1
-
-                values.loc[idx] = max(1, int(base_value))
-            else:
-                values.loc[idx] = 1
-
-        return values
+        # Players without ADP data (or outside the rosterable pool) get $1
+        return _ADP_VALUE_TABLE[_adp_table_index(adp, roster_spots, len(_ADP_VALUE_TABLE) - 1)]
 
     def _blend_values(
         self,
-        z_score_values: pd.Series,
-        adp_values: pd.Series,
-        df: pd.DataFrame,
+        z_vals: np.ndarray,
+        adp_vals: np.ndarray,
+        blend_weights: np.ndarray,
         adp_weight: float
-    ) -> pd.Series:
+    ) -> np.ndarray:
         """Blend z-score and ADP-based values with variable weighting"""
-        blended = pd.Series(1, index=z_score_values.index)
-
-        for idx in z_score_values.index:
-            adp_rank = df.loc[idx, 'adp_rank'] if 'adp_rank' in df.columns else None
-
-            if adp_rank and adp_rank <= 200:
-                # Variable weighting based on ADP rank - reduced ADP influence
-                if adp_rank <= 20:
-                    # Top 20: 35% ADP weight
-                    weight = 0.35
-                elif adp_rank <= 40:
-                    # Top 40: 20% ADP weight
-                    weight = 0.20
-                elif adp_rank <= 60:
-                    # Top 60: 10% ADP weight
-                    weight = 0.10
-                else:
-                    # Beyond 60: 0% ADP weight (pure z-scores)
-                    weight = 0.0
-
-                # Blend the values
-                blended_value = (adp_values.loc[idx] * weight +
-                                z_score_values.loc[idx] * (1 - weight))
-                blended.loc[idx] = max(1, int(round(blended_value)))
-            else:
-                # No ADP data, use pure z-score value
-                blended.loc[idx] = z_score_values.loc[idx]
-
-        return blended
\ No newline at end of file
+        blended_values = np.maximum(
+            1, np.rint(adp_vals * blend_weights + z_vals * (1 - blend_weights))
+        )
+
+        # No ADP weight, use pure z-score value
+        return np.where(blend_weights > 0, blended_values, z_vals).astype(int)
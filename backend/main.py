@@ -1,17 +1,31 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
-import json
 import io
 import csv
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
 
+import orjson
+import pandas as pd
+
 from scraper import NBADataScraper
 from calculator import AuctionValueCalculator
 
-app = FastAPI(title="NBA Auction Value Calculator")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the scraper's pooled HTTP connections
+    await scraper.close()
+
+app = FastAPI(
+    title="NBA Auction Value Calculator",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -24,6 +38,32 @@ app.add_middleware(
 scraper = NBADataScraper()
 calculator = AuctionValueCalculator()
 
+# Prepared player frames keyed by (season, min_games). Repeated /calculate
+# calls (e.g. while adjusting category weights) reuse the frame instead of
+# rebuilding the DataFrame and re-running the per-player preparation.
+MAX_CACHED_PLAYER_FRAMES = 8
+player_frames = OrderedDict()  # (season, min_games) -> (players, DataFrame)
+
+async def get_player_frame(season: str, min_games: int) -> pd.DataFrame:
+    # The scraper owns caching and expiry, so a frame is reused only while
+    # the scraper hands back the very list it was built from
+    players = await scraper.get_player_stats(season, min_games)
+
+    key = (season, min_games)
+    cached = player_frames.get(key)
+    if cached and cached[0] is players:
+        player_frames.move_to_end(key)
+        return cached[1]
+
+    df = calculator.prepare_players(players)
+
+    player_frames[key] = (players, df)
+    player_frames.move_to_end(key)
+    while len(player_frames) > MAX_CACHED_PLAYER_FRAMES:
+        player_frames.popitem(last=False)
+
+    return df
+
 class CalculateRequest(BaseModel):
     season: Optional[str] = "2025"
     min_games: Optional[int] = 20
@@ -54,14 +94,16 @@ async def get_players(
 ):
     try:
         players = await scraper.get_player_stats(season, min_games)
-        return players
+        # Returning the response directly skips FastAPI's jsonable_encoder
+        # pass, so the list is only walked once, by orjson
+        return ORJSONResponse(players)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/calculate")
 async def calculate_values(request: CalculateRequest):
     try:
-        players = await scraper.get_player_stats(request.season, request.min_games)
+        players = await get_player_frame(request.season, request.min_games)
 
         values = calculator.calculate_auction_values(
             players,
@@ -70,27 +112,54 @@ async def calculate_values(request: CalculateRequest):
             inflation_rate=request.inflation_rate,
             league_teams=request.league_teams,
             roster_size=request.roster_size,
-            budget=request.budget
+            budget=request.budget,
+            prepared=True
         )
 
-        return values
+        return ORJSONResponse(values)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Rows written per chunk of the streamed CSV export
+CSV_BATCH_ROWS = 500
+
+def iter_csv(buffer: io.StringIO, writer: Optional[csv.DictWriter], rows: List[Dict[str, Any]]):
+    """Yield what is already in buffer, then the rows in encoded batches"""
+    def drain() -> bytes:
+        chunk = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    yield drain()
+    for start in range(0, len(rows), CSV_BATCH_ROWS):
+        writer.writerows(rows[start:start + CSV_BATCH_ROWS])
+        yield drain()
+
 @app.post("/export/csv")
 async def export_csv(
     data: List[Dict[str, Any]]
 ):
     try:
         output = io.StringIO()
+        writer = None
         if data:
             writer = csv.DictWriter(output, fieldnames=data[0].keys())
+
+            # Rows are written after the response has started, so reject
+            # columns missing from the header now while this can still 500
+            fieldnames = set(writer.fieldnames)
+            extra_fields = {key for row in data for key in row if key not in fieldnames}
+            if extra_fields:
+                raise ValueError(
+                    "dict contains fields not in fieldnames: "
+                    + ", ".join(repr(field) for field in extra_fields)
+                )
+
             writer.writeheader()
-            writer.writerows(data)
 
-        output.seek(0)
         return StreamingResponse(
-            io.BytesIO(output.getvalue().encode()),
+            iter_csv(output, writer, data),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename=nba_auction_values_{datetime.now().strftime('%Y%m%d')}.csv"
@@ -104,9 +173,9 @@ async def export_json(
     data: List[Dict[str, Any]]
 ):
     try:
-        json_str = json.dumps(data, indent=2)
+        json_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
         return StreamingResponse(
-            io.BytesIO(json_str.encode()),
+            io.BytesIO(json_bytes),
             media_type="application/json",
             headers={
                 "Content-Disposition": f"attachment; filename=nba_auction_values_{datetime.now().strftime('%Y%m%d')}.json"
@@ -1,41 +1,251 @@
 import asyncio
 import pandas as pd
 import numpy as np
-from bs4 import BeautifulSoup
-import httpx
+from lxml import html as lxml_html
 import aiohttp
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime, timedelta
-import json
+from functools import lru_cache
+import orjson
 import os
 import logging
+import re
+import unicodedata
 from nba_api.stats.static import players
 from nba_api.stats.endpoints import playergamelog, leagueleaders
 
 logger = logging.getLogger(__name__)
 
+# Per-game counting stats that are also stored as season totals
+_PER_GAME_STATS = (
+    'points', 'rebounds', 'assists', 'steals', 'blocks',
+    'threes', 'fgm', 'fga', 'ftm', 'fta', 'turnovers'
+)
+
+# NBA API LeagueLeaders columns -> per-game stat fields
+_NBA_API_STAT_COLUMNS = {
+    'MIN': 'minutes', 'PTS': 'points', 'REB': 'rebounds', 'AST': 'assists',
+    'STL': 'steals', 'BLK': 'blocks', 'FG3M': 'threes', 'FGM': 'fgm',
+    'FGA': 'fga', 'FTM': 'ftm', 'FTA': 'fta', 'TOV': 'turnovers',
+    'FG_PCT': 'fg_pct', 'FT_PCT': 'ft_pct'
+}
+
+# Team codes Basketball Reference uses for a traded player's combined row
+_TOTAL_TEAMS = frozenset({'TOT', '2TM', '3TM', '4TM'})
+
+# Position abbreviation trailing a player name in the ADP table
+_POSITION_SUFFIX_RE = re.compile(r' (?:PG|SG|SF|PF|C|G|F)$')
+
+# Basketball Reference data-stat attributes for the per-game stat fields
+_BBR_STAT_FIELDS = (
+    ('minutes', 'mp_per_g'), ('points', 'pts_per_g'), ('rebounds', 'trb_per_g'),
+    ('assists', 'ast_per_g'), ('steals', 'stl_per_g'), ('blocks', 'blk_per_g'),
+    ('threes', 'fg3_per_g'), ('fgm', 'fg_per_g'), ('fga', 'fga_per_g'),
+    ('ftm', 'ft_per_g'), ('fta', 'fta_per_g'), ('turnovers', 'tov_per_g'),
+    ('fg_pct', 'fg_pct'), ('ft_pct', 'ft_pct')
+)
+
+def _stat_value(row: Dict[str, str], stat: str) -> float:
+    """Parse a scraped stat cell, treating missing or empty cells as 0"""
+    value = row.get(stat)
+    return float(value) if value else 0.0
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Normalize player names for matching"""
+    # Plain ASCII names have no accents to strip
+    if name.isascii():
+        return name.lower().strip()
+
+    # Remove accents and special characters
+    normalized = unicodedata.normalize('NFD', name)
+    normalized = ''.join(char for char in normalized if unicodedata.category(char) != 'Mn')
+    return normalized.lower().strip()
+
+# Mock ADP data - top players with realistic ADPs, used when the ADP
+# scrape fails
+_MOCK_ADP = {
+    'Nikola Jokic': {'adp': 1.2, 'adp_rank': 1},
+    'Luka Doncic': {'adp': 2.5, 'adp_rank': 2},
+    'Giannis Antetokounmpo': {'adp': 3.1, 'adp_rank': 3},
+    'Jayson Tatum': {'adp': 4.8, 'adp_rank': 4},
+    'Joel Embiid': {'adp': 5.3, 'adp_rank': 5},
+    'Shai Gilgeous-Alexander': {'adp': 6.2, 'adp_rank': 6},
+    'Stephen Curry': {'adp': 7.5, 'adp_rank': 7},
+    'Tyrese Haliburton': {'adp': 8.1, 'adp_rank': 8},
+    'Damian Lillard': {'adp': 9.7, 'adp_rank': 9},
+    'Anthony Davis': {'adp': 10.4, 'adp_rank': 10},
+    'LeBron James': {'adp': 11.8, 'adp_rank': 11},
+    'Kevin Durant': {'adp': 12.3, 'adp_rank': 12},
+    'Donovan Mitchell': {'adp': 13.6, 'adp_rank': 13},
+    'Anthony Edwards': {'adp': 14.2, 'adp_rank': 14},
+    'Jaylen Brown': {'adp': 15.9, 'adp_rank': 15},
+    'Karl-Anthony Towns': {'adp': 16.7, 'adp_rank': 16},
+    'Domantas Sabonis': {'adp': 17.4, 'adp_rank': 17},
+    'Trae Young': {'adp': 18.8, 'adp_rank': 18},
+    'Paolo Banchero': {'adp': 19.5, 'adp_rank': 19},
+    'Devin Booker': {'adp': 20.3, 'adp_rank': 20},
+    'Scottie Barnes': {'adp': 21.7, 'adp_rank': 21},
+    'Chet Holmgren': {'adp': 22.4, 'adp_rank': 22},
+    'Victor Wembanyama': {'adp': 23.1, 'adp_rank': 23},
+    'Lauri Markkanen': {'adp': 24.8, 'adp_rank': 24},
+    'Bam Adebayo': {'adp': 25.5, 'adp_rank': 25},
+    'De\'Aaron Fox': {'adp': 26.9, 'adp_rank': 26},
+    'Paul George': {'adp': 27.6, 'adp_rank': 27},
+    'Jimmy Butler': {'adp': 28.3, 'adp_rank': 28},
+    'Kawhi Leonard': {'adp': 29.7, 'adp_rank': 29},
+    'Ja Morant': {'adp': 30.4, 'adp_rank': 30},
+    'Zion Williamson': {'adp': 31.8, 'adp_rank': 31},
+    'Jalen Brunson': {'adp': 32.5, 'adp_rank': 32},
+    'Kyrie Irving': {'adp': 33.2, 'adp_rank': 33},
+    'Franz Wagner': {'adp': 34.9, 'adp_rank': 34},
+    'Alperen Sengun': {'adp': 35.6, 'adp_rank': 35},
+    'Jaren Jackson Jr.': {'adp': 36.3, 'adp_rank': 36},
+    'Pascal Siakam': {'adp': 37.7, 'adp_rank': 37},
+    'Mikal Bridges': {'adp': 38.4, 'adp_rank': 38},
+    'CJ McCollum': {'adp': 39.1, 'adp_rank': 39},
+    'Nikola Vucevic': {'adp': 40.8, 'adp_rank': 40},
+    'Myles Turner': {'adp': 41.5, 'adp_rank': 41},
+    'Fred VanVleet': {'adp': 42.2, 'adp_rank': 42},
+    'Jrue Holiday': {'adp': 43.6, 'adp_rank': 43},
+    'Rudy Gobert': {'adp': 44.3, 'adp_rank': 44},
+    'Desmond Bane': {'adp': 45.0, 'adp_rank': 45},
+    'Jusuf Nurkic': {'adp': 100.2, 'adp_rank': 100}
+}
+
+# Mock ADP data keyed by normalized name
+_FALLBACK_ADP = {_normalize_name(name): data for name, data in _MOCK_ADP.items()}
+
+def _add_season_totals(stats: pd.DataFrame):
+    """Add total_* columns (per-game stat x games) in one vectorized pass"""
+    games = stats['games'].to_numpy()
+    for stat in _PER_GAME_STATS:
+        stats[f'total_{stat}'] = stats[stat].to_numpy() * games
+
+def _conditional_headers(response_headers) -> Dict[str, str]:
+    """Build If-None-Match/If-Modified-Since headers from a response's validators"""
+    headers = {}
+    if 'ETag' in response_headers:
+        headers['If-None-Match'] = response_headers['ETag']
+    if 'Last-Modified' in response_headers:
+        headers['If-Modified-Since'] = response_headers['Last-Modified']
+    return headers
+
+def _element_text(element) -> str:
+    """Join an element's stripped text fragments (like BeautifulSoup's get_text(strip=True))"""
+    return ''.join(text.strip() for text in element.itertext())
+
+# Decoded stats kept in memory; keys come from request parameters, so the
+# least recently used entries are evicted past this
+_MAX_MEMORY_CACHE_ENTRIES = 8
+
 class NBADataScraper:
     def __init__(self):
         self.cache_dir = "cache"
         self.cache_duration = timedelta(hours=1)
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Decoded cache files keyed by (season, min_games) -> (mtime, players)
+        self._memory_cache: OrderedDict[Tuple[str, int], Tuple[float, List[Dict]]] = OrderedDict()
+        # Fetches in progress keyed by (season, min_games), shared by concurrent callers
+        self._inflight: Dict[Tuple[str, int], asyncio.Task] = {}
+        # Parsed results of fetched pages keyed by URL -> (revalidation headers, result)
+        self._page_cache: Dict[str, Tuple[Dict[str, str], object]] = {}
+        # Bounds the number of outbound requests running at once
+        self._request_semaphore = asyncio.Semaphore(5)
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        # Created lazily so the session binds to the running event loop;
+        # keeping it alive reuses connections instead of a new handshake per fetch
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _remember_stats(self, cache_key: Tuple[str, int], mtime: float, data: List[Dict]):
+        """Keep decoded stats in memory, evicting the least recently used entry"""
+        self._memory_cache[cache_key] = (mtime, data)
+        self._memory_cache.move_to_end(cache_key)
+        while len(self._memory_cache) > _MAX_MEMORY_CACHE_ENTRIES:
+            self._memory_cache.popitem(last=False)
+
+    def _revalidation_headers(self, url: str) -> Dict[str, str]:
+        """Conditional headers letting the server answer 304 for an unchanged page"""
+        cached = self._page_cache.get(url)
+        return cached[0] if cached else {}
+
+    def _remember_page(self, url: str, validators: Dict[str, str], result):
+        """Keep a page's parsed result for reuse when the server answers 304"""
+        if validators:
+            self._page_cache[url] = (validators, result)
+
     async def get_player_stats(self, season: str = "2025", min_games: int = 10) -> List[Dict]:
         # Ensure cache directory exists
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
 
         cache_file = os.path.join(self.cache_dir, f"nba_stats_{season}_{min_games}.json")
+        cache_key = (season, min_games)
 
         if self._is_cache_valid(cache_file):
-            with open(cache_file, 'r') as f:
-                return json.load(f)
+            # Skip decoding the file again while it is unchanged on disk
+            mtime = os.path.getmtime(cache_file)
+            cached = self._memory_cache.get(cache_key)
+            if cached and cached[0] == mtime:
+                self._memory_cache.move_to_end(cache_key)
+                return cached[1]
+
+            # Read and decode off the event loop
+            data = await asyncio.to_thread(self._read_cache_file, cache_file)
+            self._remember_stats(cache_key, mtime, data)
+            return data
+
+        # Expired data is never served again, so don't keep it alive
+        self._memory_cache.pop(cache_key, None)
+
+        # Concurrent cache misses for the same key wait on a single fetch.
+        # Shielded so one caller disconnecting doesn't cancel it for the rest.
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_player_stats(season, min_games, cache_file, cache_key)
+            )
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch_player_stats(
+        self,
+        season: str,
+        min_games: int,
+        cache_file: str,
+        cache_key: Tuple[str, int]
+    ) -> List[Dict]:
+        # The stats scrape and the ADP fetch are independent network calls,
+        # so run them concurrently and handle each failure afterwards
+        stats_result, adp_result = await asyncio.gather(
+            self._scrape_basketball_reference(season, min_games),
+            self._fetch_adp_data(),
+            return_exceptions=True
+        )
 
         try:
             # For testing, we'll use sample data first
             # In production, uncomment the line below
-            data = await self._scrape_basketball_reference(season, min_games)
+            if isinstance(stats_result, BaseException):
+                raise stats_result
+            data = stats_result
             # data = self._load_sample_data()
         except Exception as e:
             print(f"Basketball Reference scraping failed: {e}")
@@ -45,10 +255,11 @@ class NBADataScraper:
                 print(f"NBA API fetch failed: {e2}")
                 data = self._load_sample_data()
 
-        # Fetch and merge ADP data
+        # Merge ADP data
         try:
-            adp_data = await self._fetch_adp_data()
-            data = self._merge_adp_data(data, adp_data)
+            if isinstance(adp_result, BaseException):
+                raise adp_result
+            data = self._merge_adp_data(data, adp_result)
         except Exception as e:
             print(f"ADP fetch failed: {e}")
             # Add default ADP values if fetch fails
@@ -56,69 +267,33 @@ class NBADataScraper:
                 player['adp'] = None
                 player['adp_rank'] = None
 
-        with open(cache_file, 'w') as f:
-            json.dump(data, f)
+        await asyncio.to_thread(self._write_cache_file, cache_file, data)
+        self._remember_stats(cache_key, os.path.getmtime(cache_file), data)
 
         return data
 
     async def _scrape_basketball_reference(self, season: str, min_games: int) -> List[Dict]:
         url = f"https://www.basketball-reference.com/leagues/NBA_{season}_per_game.html"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers={
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, 'lxml')
-        table = soup.find('table', {'id': 'per_game_stats'})
-
-        if not table:
-            raise ValueError("Could not find stats table")
-
-        headers = []
-        for th in table.find('thead').find_all('tr')[-1].find_all('th'):
-            headers.append(th.get('data-stat', ''))
-
-        rows = []
-        tbody = table.find('tbody')
-        if not tbody:
-            return []
-
-        all_trs = tbody.find_all('tr')
-
-        for tr in all_trs[:5]:
-            # Skip header rows that appear in tbody
-            if tr.get('class') and 'thead' in ' '.join(tr.get('class', [])):
-                continue
-
-            row_data = {}
-            for td in tr.find_all(['th', 'td']):
-                stat = td.get('data-stat', '')
-                value = td.text.strip()
-                row_data[stat] = value
-
-            # The player name field might be 'player' or 'name_display' depending on the page
-            player_name = row_data.get('player') or row_data.get('name_display')
-            if row_data and player_name:  # Make sure we have a player name
-                row_data['player'] = player_name  # Normalize to 'player' key
-                rows.append(row_data)
-
-        # Process rest of rows without debug
-        for tr in all_trs[5:]:
-            if tr.get('class') and 'thead' in ' '.join(tr.get('class', [])):
-                continue
-
-            row_data = {}
-            for td in tr.find_all(['th', 'td']):
-                stat = td.get('data-stat', '')
-                value = td.text.strip()
-                row_data[stat] = value
-
-            player_name = row_data.get('player') or row_data.get('name_display')
-            if row_data and player_name:
-                row_data['player'] = player_name
-                rows.append(row_data)
+        rows = None
+        session = self._get_session()
+        async with self._request_semaphore:
+            async with session.get(url, headers={
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                **self._revalidation_headers(url)
+            }, timeout=aiohttp.ClientTimeout(total=30.0)) as response:
+                if response.status == 304 and url in self._page_cache:
+                    # Page unchanged since the last fetch, reuse its parsed rows
+                    rows = self._page_cache[url][1]
+                else:
+                    response.raise_for_status()
+                    # Raw bytes; lxml reads the charset from the page's meta tag
+                    html = await response.read()
+                    validators = _conditional_headers(response.headers)
+
+        if rows is None:
+            rows = self._parse_stats_rows(html)
+            self._remember_page(url, validators, rows)
 
         processed_data = []
         for row in rows:
@@ -132,60 +307,63 @@ class NBADataScraper:
                     'team': row.get('team_id') or row.get('team_name_abbr', ''),
                     'position': row.get('pos', ''),
                     'games': games,
-                    'minutes': float(row.get('mp_per_g', '0') or '0'),
-                    'points': float(row.get('pts_per_g', '0') or '0'),
-                    'rebounds': float(row.get('trb_per_g', '0') or '0'),
-                    'assists': float(row.get('ast_per_g', '0') or '0'),
-                    'steals': float(row.get('stl_per_g', '0') or '0'),
-                    'blocks': float(row.get('blk_per_g', '0') or '0'),
-                    'threes': float(row.get('fg3_per_g', '0') or '0'),
-                    'fgm': float(row.get('fg_per_g', '0') or '0'),
-                    'fga': float(row.get('fga_per_g', '0') or '0'),
-                    'ftm': float(row.get('ft_per_g', '0') or '0'),
-                    'fta': float(row.get('fta_per_g', '0') or '0'),
-                    'turnovers': float(row.get('tov_per_g', '0') or '0'),
-                    'fg_pct': float(row.get('fg_pct', '0') or '0'),
-                    'ft_pct': float(row.get('ft_pct', '0') or '0')
+                    **{field: _stat_value(row, stat) for field, stat in _BBR_STAT_FIELDS}
                 }
 
-                player_data['total_points'] = player_data['points'] * player_data['games']
-                player_data['total_rebounds'] = player_data['rebounds'] * player_data['games']
-                player_data['total_assists'] = player_data['assists'] * player_data['games']
-                player_data['total_steals'] = player_data['steals'] * player_data['games']
-                player_data['total_blocks'] = player_data['blocks'] * player_data['games']
-                player_data['total_threes'] = player_data['threes'] * player_data['games']
-                player_data['total_fgm'] = player_data['fgm'] * player_data['games']
-                player_data['total_fga'] = player_data['fga'] * player_data['games']
-                player_data['total_ftm'] = player_data['ftm'] * player_data['games']
-                player_data['total_fta'] = player_data['fta'] * player_data['games']
-                player_data['total_turnovers'] = player_data['turnovers'] * player_data['games']
-
                 processed_data.append(player_data)
 
             except (ValueError, TypeError) as e:
                 print(f"Error processing row: {e}")
                 continue
 
-        # Deduplicate players - preferring TOT/2TM rows, or summing if needed
+        # Deduplicate players - the official total row (TOT/2TM/...) wins,
+        # otherwise keep the row with more games (traded with no total row)
         deduplicated = {}
+        priorities = {}
         for player in processed_data:
             name = player['name']
-            team = player['team']
-
-            if team in ['TOT', '2TM', '3TM', '4TM']:
-                # This is the official total, always use it
-                deduplicated[name] = player
-            elif name not in deduplicated:
-                # First time seeing this player
+            priority = (player['team'] in _TOTAL_TEAMS, player['games'])
+            if name not in priorities or priority > priorities[name]:
                 deduplicated[name] = player
-            elif deduplicated[name]['team'] not in ['TOT', '2TM', '3TM', '4TM']:
-                # We already have this player but no total row exists
-                # This means they were traded but no TOT row - shouldn't happen but handle it
-                # Keep the one with more games
-                if player['games'] > deduplicated[name]['games']:
-                    deduplicated[name] = player
+                priorities[name] = priority
+
+        if not deduplicated:
+            return []
 
-        return list(deduplicated.values())
+        stats = pd.DataFrame(list(deduplicated.values()))
+        _add_season_totals(stats)
+        return stats.to_dict(orient='records')
+
+    def _parse_stats_rows(self, html: bytes) -> List[Dict[str, str]]:
+        """Parse the per-game stats table into {data-stat: text} rows"""
+        # Parse straight into an lxml tree and select only the stats rows
+        tree = lxml_html.fromstring(html)
+        tables = tree.xpath('//table[@id="per_game_stats"]')
+
+        if not tables:
+            raise ValueError("Could not find stats table")
+
+        tbodies = tables[0].xpath('.//tbody')
+        if not tbodies:
+            return []
+
+        # Skip header rows that appear in tbody
+        all_trs = tbodies[0].xpath('.//tr[not(contains(@class, "thead"))]')
+
+        rows = []
+        for tr in all_trs:
+            row_data = {
+                cell.get('data-stat', ''): cell.text_content().strip()
+                for cell in tr.xpath('.//th | .//td')
+            }
+
+            # The player name field might be 'player' or 'name_display' depending on the page
+            player_name = row_data.get('player') or row_data.get('name_display')
+            if row_data and player_name:  # Make sure we have a player name
+                row_data['player'] = player_name  # Normalize to 'player' key
+                rows.append(row_data)
+
+        return rows
 
     def _fetch_from_nba_api(self, season: str, min_games: int) -> List[Dict]:
         season_str = f"{int(season)-1}-{season[-2:]}"
@@ -199,48 +377,19 @@ class NBADataScraper:
             )
 
             df = leaders.get_data_frames()[0]
+            df = df[df['GP'] >= min_games]
 
-            processed_data = []
-            for _, row in df.iterrows():
-                if row['GP'] < min_games:
-                    continue
-
-                player_data = {
-                    'name': row['PLAYER'],
-                    'team': row.get('TEAM', ''),
-                    'position': row.get('PLAYER_POSITION', ''),
-                    'games': int(row['GP']),
-                    'minutes': float(row.get('MIN', 0)),
-                    'points': float(row.get('PTS', 0)),
-                    'rebounds': float(row.get('REB', 0)),
-                    'assists': float(row.get('AST', 0)),
-                    'steals': float(row.get('STL', 0)),
-                    'blocks': float(row.get('BLK', 0)),
-                    'threes': float(row.get('FG3M', 0)),
-                    'fgm': float(row.get('FGM', 0)),
-                    'fga': float(row.get('FGA', 0)),
-                    'ftm': float(row.get('FTM', 0)),
-                    'fta': float(row.get('FTA', 0)),
-                    'turnovers': float(row.get('TOV', 0)),
-                    'fg_pct': float(row.get('FG_PCT', 0)),
-                    'ft_pct': float(row.get('FT_PCT', 0))
-                }
+            # Build the player records column-wise instead of row by row
+            stats = pd.DataFrame(index=df.index)
+            stats['name'] = df['PLAYER']
+            stats['team'] = df.get('TEAM', '')
+            stats['position'] = df.get('PLAYER_POSITION', '')
+            stats['games'] = df['GP'].astype(int)
+            for column, stat in _NBA_API_STAT_COLUMNS.items():
+                stats[stat] = df[column].astype(float) if column in df.columns else 0.0
 
-                player_data['total_points'] = player_data['points'] * player_data['games']
-                player_data['total_rebounds'] = player_data['rebounds'] * player_data['games']
-                player_data['total_assists'] = player_data['assists'] * player_data['games']
-                player_data['total_steals'] = player_data['steals'] * player_data['games']
-                player_data['total_blocks'] = player_data['blocks'] * player_data['games']
-                player_data['total_threes'] = player_data['threes'] * player_data['games']
-                player_data['total_fgm'] = player_data['fgm'] * player_data['games']
-                player_data['total_fga'] = player_data['fga'] * player_data['games']
-                player_data['total_ftm'] = player_data['ftm'] * player_data['games']
-                player_data['total_fta'] = player_data['fta'] * player_data['games']
-                player_data['total_turnovers'] = player_data['turnovers'] * player_data['games']
-
-                processed_data.append(player_data)
-
-            return processed_data
+            _add_season_totals(stats)
+            return stats.to_dict(orient='records')
 
         except Exception as e:
             print(f"NBA API error: {e}")
@@ -311,8 +460,7 @@ class NBADataScraper:
         ]
 
         for player in sample_players:
-            for stat in ['points', 'rebounds', 'assists', 'steals', 'blocks',
-                        'threes', 'fgm', 'fga', 'ftm', 'fta', 'turnovers']:
+            for stat in _PER_GAME_STATS:
                 player[f'total_{stat}'] = player[stat] * player['games']
             player['fg_pct'] = player['fgm'] / player['fga'] if player['fga'] > 0 else 0
             player['ft_pct'] = player['ftm'] / player['fta'] if player['fta'] > 0 else 0
@@ -324,33 +472,41 @@ class NBADataScraper:
         try:
             url = "https://www.fantasypros.com/nba/adp/overall.php"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers={'User-Agent': 'Mozilla/5.0'}) as response:
+            session = self._get_session()
+            async with self._request_semaphore:
+                async with session.get(url, headers={
+                    'User-Agent': 'Mozilla/5.0', **self._revalidation_headers(url)
+                }) as response:
+                    if response.status == 304 and url in self._page_cache:
+                        # ADP table unchanged since the last fetch
+                        return self._page_cache[url][1]
+
                     if response.status != 200:
                         logger.warning(f"Failed to fetch ADP data: {response.status}")
                         return self._get_fallback_adp()
 
-                    html = await response.text()
+                    html = await response.read()
+                    validators = _conditional_headers(response.headers)
 
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = lxml_html.fromstring(html)
 
             # Find the ADP table
-            table = soup.find('table', {'id': 'data'})
-            if not table:
+            tables = tree.xpath('//table[@id="data"]')
+            if not tables:
                 # Try alternative table selectors
-                table = soup.find('table', class_='table')
+                tables = tree.xpath('//table[contains(concat(" ", normalize-space(@class), " "), " table ")]')
 
-            if not table:
+            if not tables:
                 logger.warning("Could not find ADP table")
                 return self._get_fallback_adp()
 
             adp_data = {}
 
             # Parse table rows
-            rows = table.find_all('tr')[1:]  # Skip header
+            rows = tables[0].xpath('.//tr')[1:]  # Skip header
 
             for idx, row in enumerate(rows, 1):
-                cols = row.find_all('td')
+                cols = row.xpath('.//td')
                 if len(cols) < 3:
                     continue
 
@@ -362,27 +518,25 @@ class NBADataScraper:
                     player_name = None
 
                     # Try to find an anchor tag first
-                    anchor = player_cell.find('a')
-                    if anchor:
-                        player_name = anchor.get_text(strip=True)
+                    anchor = player_cell.find('.//a')
+                    if anchor is not None:
+                        player_name = _element_text(anchor)
                     else:
                         # Fall back to direct text
-                        player_name = player_cell.get_text(strip=True)
+                        player_name = _element_text(player_cell)
 
                     # Clean up the name (remove team/position info if present)
                     if player_name:
                         # Remove anything in parentheses
-                        player_name = player_name.split('(')[0].strip()
+                        player_name = player_name.split('(', 1)[0].strip()
                         # Remove position abbreviations at the end
-                        for pos in [' PG', ' SG', ' SF', ' PF', ' C', ' G', ' F']:
-                            if player_name.endswith(pos):
-                                player_name = player_name[:-len(pos)]
+                        player_name = _POSITION_SUFFIX_RE.sub('', player_name)
 
                         # Get ADP value - usually in column 3 or 4
                         adp_value = None
                         for col_idx in [2, 3, 4]:
                             if col_idx < len(cols):
-                                adp_text = cols[col_idx].get_text(strip=True)
+                                adp_text = _element_text(cols[col_idx])
                                 try:
                                     adp_value = float(adp_text)
                                     break
@@ -390,15 +544,15 @@ class NBADataScraper:
                                     continue
 
                         if adp_value:
-                            normalized_name = self._normalize_name(player_name)
+                            normalized_name = _normalize_name(player_name)
                             adp_data[normalized_name] = {
                                 'adp': adp_value,
                                 'adp_rank': idx
                             }
-                            logger.info(f"Found ADP: {player_name} = {adp_value} (rank {idx})")
+                            logger.debug("Found ADP: %s = %s (rank %d)", player_name, adp_value, idx)
 
                 except Exception as e:
-                    logger.debug(f"Error parsing row {idx}: {e}")
+                    logger.debug("Error parsing row %d: %s", idx, e)
                     continue
 
             if not adp_data:
@@ -406,6 +560,7 @@ class NBADataScraper:
                 return self._get_fallback_adp()
 
             logger.info(f"Successfully parsed {len(adp_data)} players' ADP data")
+            self._remember_page(url, validators, adp_data)
             return adp_data
 
         except Exception as e:
@@ -414,98 +569,42 @@ class NBADataScraper:
 
     def _get_fallback_adp(self) -> Dict[str, Dict]:
         """Return fallback ADP data if scraping fails"""
-        # Mock ADP data - top players with realistic ADPs
-        mock_adp = {
-            'Nikola Jokic': {'adp': 1.2, 'adp_rank': 1},
-            'Luka Doncic': {'adp': 2.5, 'adp_rank': 2},
-            'Giannis Antetokounmpo': {'adp': 3.1, 'adp_rank': 3},
-            'Jayson Tatum': {'adp': 4.8, 'adp_rank': 4},
-            'Joel Embiid': {'adp': 5.3, 'adp_rank': 5},
-            'Shai Gilgeous-Alexander': {'adp': 6.2, 'adp_rank': 6},
-            'Stephen Curry': {'adp': 7.5, 'adp_rank': 7},
-            'Tyrese Haliburton': {'adp': 8.1, 'adp_rank': 8},
-            'Damian Lillard': {'adp': 9.7, 'adp_rank': 9},
-            'Anthony Davis': {'adp': 10.4, 'adp_rank': 10},
-            'LeBron James': {'adp': 11.8, 'adp_rank': 11},
-            'Kevin Durant': {'adp': 12.3, 'adp_rank': 12},
-            'Donovan Mitchell': {'adp': 13.6, 'adp_rank': 13},
-            'Anthony Edwards': {'adp': 14.2, 'adp_rank': 14},
-            'Jaylen Brown': {'adp': 15.9, 'adp_rank': 15},
-            'Karl-Anthony Towns': {'adp': 16.7, 'adp_rank': 16},
-            'Domantas Sabonis': {'adp': 17.4, 'adp_rank': 17},
-            'Trae Young': {'adp': 18.8, 'adp_rank': 18},
-            'Paolo Banchero': {'adp': 19.5, 'adp_rank': 19},
-            'Devin Booker': {'adp': 20.3, 'adp_rank': 20},
-            'Scottie Barnes': {'adp': 21.7, 'adp_rank': 21},
-            'Chet Holmgren': {'adp': 22.4, 'adp_rank': 22},
-            'Victor Wembanyama': {'adp': 23.1, 'adp_rank': 23},
-            'Lauri Markkanen': {'adp': 24.8, 'adp_rank': 24},
-            'Bam Adebayo': {'adp': 25.5, 'adp_rank': 25},
-            'De\'Aaron Fox': {'adp': 26.9, 'adp_rank': 26},
-            'Paul George': {'adp': 27.6, 'adp_rank': 27},
-            'Jimmy Butler': {'adp': 28.3, 'adp_rank': 28},
-            'Kawhi Leonard': {'adp': 29.7, 'adp_rank': 29},
-            'Ja Morant': {'adp': 30.4, 'adp_rank': 30},
-            'Zion Williamson': {'adp': 31.8, 'adp_rank': 31},
-            'Jalen Brunson': {'adp': 32.5, 'adp_rank': 32},
-            'Kyrie Irving': {'adp': 33.2, 'adp_rank': 33},
-            'Franz Wagner': {'adp': 34.9, 'adp_rank': 34},
-            'Alperen Sengun': {'adp': 35.6, 'adp_rank': 35},
-            'Jaren Jackson Jr.': {'adp': 36.3, 'adp_rank': 36},
-            'Pascal Siakam': {'adp': 37.7, 'adp_rank': 37},
-            'Mikal Bridges': {'adp': 38.4, 'adp_rank': 38},
-            'CJ McCollum': {'adp': 39.1, 'adp_rank': 39},
-            'Nikola Vucevic': {'adp': 40.8, 'adp_rank': 40},
-            'Myles Turner': {'adp': 41.5, 'adp_rank': 41},
-            'Fred VanVleet': {'adp': 42.2, 'adp_rank': 42},
-            'Jrue Holiday': {'adp': 43.6, 'adp_rank': 43},
-            'Rudy Gobert': {'adp': 44.3, 'adp_rank': 44},
-            'Desmond Bane': {'adp': 45.0, 'adp_rank': 45},
-            'Jusuf Nurkic': {'adp': 100.2, 'adp_rank': 100}
-        }
-
-        # Normalize all keys in mock data
-        normalized_adp = {}
-        for name, data in mock_adp.items():
-            normalized_adp[self._normalize_name(name)] = data
-
-        return normalized_adp
-
-    def _normalize_name(self, name: str) -> str:
-        """Normalize player names for matching"""
-        import unicodedata
-        # Remove accents and special characters
-        normalized = unicodedata.normalize('NFD', name)
-        normalized = ''.join(char for char in normalized if unicodedata.category(char) != 'Mn')
-        return normalized.lower().strip()
+        # Keys are normalized once at import; callers only read the dict
+        return _FALLBACK_ADP
 
     def _merge_adp_data(self, players: List[Dict], adp_data: Dict[str, Dict]) -> List[Dict]:
         """Merge ADP data with player statistics"""
         # ADP data should already have normalized keys
+        players_without_adp = []
         for player in players:
-            normalized_player_name = self._normalize_name(player['name'])
-
             # Try normalized match (ADP data keys are already normalized)
-            if normalized_player_name in adp_data:
-                player['adp'] = adp_data[normalized_player_name]['adp']
-                player['adp_rank'] = adp_data[normalized_player_name]['adp_rank']
+            adp_entry = adp_data.get(_normalize_name(player['name']))
+            if adp_entry is not None:
+                player['adp'] = adp_entry['adp']
+                player['adp_rank'] = adp_entry['adp_rank']
             else:
                 # For players not in top ADP, estimate based on their position in our data
-                player['adp'] = None
-                player['adp_rank'] = None
-
-        # Sort by ADP rank for players that have it
-        players_with_adp = [p for p in players if p['adp_rank'] is not None]
-        players_without_adp = [p for p in players if p['adp_rank'] is None]
+                players_without_adp.append(player)
 
         # Assign estimated ADP ranks to remaining players
-        start_rank = len(players_with_adp) + 1
+        start_rank = len(players) - len(players_without_adp) + 1
         for i, player in enumerate(players_without_adp):
-            player['adp_rank'] = start_rank + i
             player['adp'] = start_rank + i + 0.5  # Estimated ADP
+            player['adp_rank'] = start_rank + i
 
         return players
 
+    def _read_cache_file(self, cache_file: str) -> List[Dict]:
+        with open(cache_file, 'rb') as f:
+            return orjson.loads(f.read())
+
+    def _write_cache_file(self, cache_file: str, data: List[Dict]):
+        # Write to a temp file and rename so readers never see a partial file
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp_file, cache_file)
+
     def _is_cache_valid(self, cache_file: str) -> bool:
         if not os.path.exists(cache_file):
             return False